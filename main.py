@@ -1,20 +1,70 @@
 #!/usr/bin/env python3
 
 import argparse
-import copy
 import json
 import os
+from dataclasses import dataclass
+from typing import Optional
 
 from tools.exceptions import ValidationError, PushoverNotificationError, TelegramNotificationError
-from tools.its import ImpfterminService
 from tools.kontaktdaten import decode_wochentag, encode_wochentag, get_kontaktdaten, \
-    validate_kontaktdaten, validate_datum
+    validate_kontaktdaten, validate_kontaktdaten_field, validate_datum, validate_zeitrahmen
 from tools.utils import create_missing_dirs, get_current_version, \
     get_latest_version, pushover_validation, remove_prefix, \
     telegram_validation, unique, update_available
 from tools.chromium_downloader import check_chromium, download_chromium, check_webdriver, download_webdriver, current_platform
 
+try:
+    import orjson
+
+    ENABLE_ORJSON = True
+except ImportError:
+    ENABLE_ORJSON = False
+
 PATH = os.path.dirname(os.path.realpath(__file__))
+DEFAULT_KONTAKTDATEN_PATH = os.path.join(PATH, "data/kontaktdaten.json")
+
+
+# Zuletzt gelesene Kontaktdaten, siehe get_kontaktdaten_cached()
+_kontaktdaten_cache = {}
+
+
+def copy_kontaktdaten(kontaktdaten):
+    """
+    Kopiert Kontaktdaten.
+    Die Kontaktdaten bestehen nur aus Dictionaries und Listen von Strings.
+    Eine Kopie der ersten beiden Ebenen genügt, da tiefer verschachtelte
+    Werte nur neu gesetzt, aber nicht verändert werden.
+
+    :param kontaktdaten: Dictionary mit Kontaktdaten
+    :return: Kopie der Kontaktdaten
+    """
+
+    return {
+        k: (dict(v) if isinstance(v, dict) else list(v) if isinstance(v, list) else v)
+        for k, v in kontaktdaten.items()}
+
+
+def get_kontaktdaten_cached(filepath):
+    """
+    Wie get_kontaktdaten(), die Datei wird aber nur erneut gelesen und
+    validiert, wenn sie sich seit dem letzten Aufruf geändert hat.
+
+    :param filepath: Pfad zur JSON-Datei mit Kontaktdaten.
+    :return: Kopie der Kontaktdaten
+    """
+
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        return {}
+
+    key = (filepath, stat.st_mtime_ns, stat.st_size)
+    if key not in _kontaktdaten_cache:
+        # Nur die zuletzt gelesene Datei behalten
+        _kontaktdaten_cache.clear()
+        _kontaktdaten_cache[key] = get_kontaktdaten(filepath)
+    return copy_kontaktdaten(_kontaktdaten_cache[key])
 
 
 def update_kontaktdaten_interactive(
@@ -41,168 +91,179 @@ def update_kontaktdaten_interactive(
     # Werfe Fehler, falls die übergebenen Kontaktdaten bereits ungültig sind.
     validate_kontaktdaten(known_kontaktdaten)
 
-    kontaktdaten = copy.deepcopy(known_kontaktdaten)
+    kontaktdaten = copy_kontaktdaten(known_kontaktdaten)
 
-    with open(filepath, 'w', encoding='utf-8') as file:
-        if "plz_impfzentren" not in kontaktdaten:
-            print(
-                "Mit einem Code kann in mehreren Impfzentren gleichzeitig nach einem Termin gesucht werden.\n"
-                "Eine Übersicht über die Gruppierung der Impfzentren findest du hier:\n"
-                "https://github.com/iamnotturner/vaccipy/wiki/Ein-Code-fuer-mehrere-Impfzentren\n\n"
-                "Trage nun die PLZ deines Impfzentrums ein. Für mehrere Impfzentren die PLZ's kommagetrennt nacheinander.\n"
-                "Beispiel: 68163, 69124, 69469\n")
-            input_kontaktdaten_key(kontaktdaten,
-                                   ["plz_impfzentren"],
-                                   "> PLZ's der Impfzentren: ",
-                                   lambda x: unique([plz.strip() for plz in x.split(",")]))
-            print()
+    if "plz_impfzentren" not in kontaktdaten:
+        print(
+            "Mit einem Code kann in mehreren Impfzentren gleichzeitig nach einem Termin gesucht werden.\n"
+            "Eine Übersicht über die Gruppierung der Impfzentren findest du hier:\n"
+            "https://github.com/iamnotturner/vaccipy/wiki/Ein-Code-fuer-mehrere-Impfzentren\n\n"
+            "Trage nun die PLZ deines Impfzentrums ein. Für mehrere Impfzentren die PLZ's kommagetrennt nacheinander.\n"
+            "Beispiel: 68163, 69124, 69469\n")
+        input_kontaktdaten_key(kontaktdaten,
+                               ["plz_impfzentren"],
+                               "> PLZ's der Impfzentren: ",
+                               lambda x: unique([plz.strip() for plz in x.split(",")]))
+        print()
+
+    if "codes" not in kontaktdaten and command == "search":
+        print(
+            "Bitte gebe jetzt die Vermittlungscodes passend zu den ausgewählten Impfzentren ein.\n"
+            "Beachte dabei, dass nur ein Vermittlungscode je Gruppierung benötigt wird.\n"
+            "Weitere Infos: https://github.com/iamnotturner/vaccipy/wiki/Ein-Code-fuer-mehrere-Impfzentren\n\n"
+            "Mehrere Vermittlungscodes müssen durch Kommas getrennt werden.\n"
+            "Beispiel: ABCD-1234-EFGH, ABCD-4321-EFGH, 1234-56AB-CDEF\n")
+        input_kontaktdaten_key(
+            kontaktdaten, ["codes"], "> Vermittlungscodes: ",
+            lambda x: unique([code.strip() for code in x.split(",")]))
+        print()
+
+    if "kontakt" not in kontaktdaten:
+        kontaktdaten["kontakt"] = {}
+
+    if "anrede" not in kontaktdaten["kontakt"] and command == "search":
+        input_kontaktdaten_key(
+            kontaktdaten, ["kontakt", "anrede"], "> Anrede (Frau/Herr/Kind/Divers): ")
+
+    if "vorname" not in kontaktdaten["kontakt"] and command == "search":
+        input_kontaktdaten_key(
+            kontaktdaten, ["kontakt", "vorname"], "> Vorname: ")
+
+    if "nachname" not in kontaktdaten["kontakt"] and command == "search":
+        input_kontaktdaten_key(
+            kontaktdaten, ["kontakt", "nachname"], "> Nachname: ")
+
+    if "strasse" not in kontaktdaten["kontakt"] and command == "search":
+        input_kontaktdaten_key(
+            kontaktdaten, ["kontakt", "strasse"], "> Strasse (ohne Hausnummer): ")
+
+    if "hausnummer" not in kontaktdaten["kontakt"] and command == "search":
+        input_kontaktdaten_key(
+            kontaktdaten, ["kontakt", "hausnummer"], "> Hausnummer: ")
+
+    if "plz" not in kontaktdaten["kontakt"] and command == "search":
+        input_kontaktdaten_key(
+            kontaktdaten, ["kontakt", "plz"], "> PLZ des Wohnorts: ")
+
+    if "ort" not in kontaktdaten["kontakt"] and command == "search":
+        input_kontaktdaten_key(
+            kontaktdaten, ["kontakt", "ort"], "> Wohnort: ")
+
+    if "phone" not in kontaktdaten["kontakt"]:
+        input_kontaktdaten_key(
+            kontaktdaten,
+            ["kontakt", "phone"],
+            "> Telefonnummer: +49",
+            lambda x: x if x.startswith("+49") else f"+49{remove_prefix(x, '0')}")
+
+    if "notificationChannel" not in kontaktdaten["kontakt"]:
+        kontaktdaten["kontakt"]["notificationChannel"] = "email"
+
+    if "notificationReceiver" not in kontaktdaten["kontakt"]:
+        input_kontaktdaten_key(
+            kontaktdaten, ["kontakt", "notificationReceiver"], "> Mail: ")
+
+    if configure_notifications:
+        if "notifications" not in kontaktdaten:
+            kontaktdaten["notifications"] = {}
+        if "pushover" not in kontaktdaten["notifications"]:
+            while True:
+                kontaktdaten["notifications"]["pushover"] = {}
+                if input("> Benachtigung mit Pushover einrichten? (y/n): ").lower() != "n":
+                    print()
+                    input_kontaktdaten_key(
+                        kontaktdaten, ["notifications", "pushover", "app_token"],
+                        "> Geben Sie den Pushover APP Token ein: ")
+                    input_kontaktdaten_key(
+                        kontaktdaten, ["notifications", "pushover", "user_key"],
+                        "> Geben Sie den Pushover User Key ein: ")
+                    try:
+                        validation_code = str(pushover_validation(kontaktdaten["notifications"]["pushover"]))
+                    except PushoverNotificationError as exc:
+                        print(f"Fehler: {exc}\nBitte versuchen Sie es erneut.")
+                        continue
+                    validation_input = input("Geben Sie den Validierungscode ein:").strip()
+                    if validation_input == validation_code:
+                        break
+                    del kontaktdaten["notifications"]["pushover"]
+                    print("Validierung fehlgeschlagen.")
+                    print()
+                else:
+                    print()
+                    break
+
+        if "telegram" not in kontaktdaten["notifications"]:
+            while True:
+                kontaktdaten["notifications"]["telegram"] = {}
+                if input("> Benachtigung mit Telegram einrichten? (y/n): ").lower() != "n":
+                    print()
+                    input_kontaktdaten_key(
+                        kontaktdaten, ["notifications", "telegram", "api_token"],
+                        "> Geben Sie den Telegram API Token ein: ")
+                    input_kontaktdaten_key(
+                        kontaktdaten, ["notifications", "telegram", "chat_id"],
+                        "> Geben Sie die Telegram Chat ID ein: ")
+                    try:
+                        validation_code = str(telegram_validation(kontaktdaten["notifications"]["telegram"]))
+                    except TelegramNotificationError as exc:
+                        print(f"Fehler: {exc}\nBitte versuchen Sie es erneut.")
+                        continue
+                    validation_input = input("Geben Sie den Validierungscode ein:").strip()
+                    if validation_input == validation_code:
+                        break
+                    del kontaktdaten["notifications"]["telegram"]
+                    print("Validierung fehlgeschlagen.")
+                    print()
+                else:
+                    print()
+                    break
 
-        if "codes" not in kontaktdaten and command == "search":
-            print(
-                "Bitte gebe jetzt die Vermittlungscodes passend zu den ausgewählten Impfzentren ein.\n"
-                "Beachte dabei, dass nur ein Vermittlungscode je Gruppierung benötigt wird.\n"
-                "Weitere Infos: https://github.com/iamnotturner/vaccipy/wiki/Ein-Code-fuer-mehrere-Impfzentren\n\n"
-                "Mehrere Vermittlungscodes müssen durch Kommas getrennt werden.\n"
-                "Beispiel: ABCD-1234-EFGH, ABCD-4321-EFGH, 1234-56AB-CDEF\n")
-            input_kontaktdaten_key(
-                kontaktdaten, ["codes"], "> Vermittlungscodes: ",
-                lambda x: unique([code.strip() for code in x.split(",")]))
+    if "zeitrahmen" not in kontaktdaten and command == "search":
+        kontaktdaten["zeitrahmen"] = {}
+        if input("> Zeitrahmen festlegen? (y/n): ").lower() != "n":
             print()
-
-        if "kontakt" not in kontaktdaten:
-            kontaktdaten["kontakt"] = {}
-
-        if "anrede" not in kontaktdaten["kontakt"] and command == "search":
             input_kontaktdaten_key(
-                kontaktdaten, ["kontakt", "anrede"], "> Anrede (Frau/Herr/Kind/Divers): ")
-
-        if "vorname" not in kontaktdaten["kontakt"] and command == "search":
+                kontaktdaten, ["zeitrahmen", "einhalten_bei"],
+                "> Für welchen Impftermin soll der Zeitrahmen gelten? (1/2/beide): ")
             input_kontaktdaten_key(
-                kontaktdaten, ["kontakt", "vorname"], "> Vorname: ")
-
-        if "nachname" not in kontaktdaten["kontakt"] and command == "search":
+                kontaktdaten, ["zeitrahmen", "von_datum"],
+                "> Von Datum (Leer lassen zum Überspringen): ",
+                lambda x: x if x else None)  # Leeren String zu None umwandeln
             input_kontaktdaten_key(
-                kontaktdaten, ["kontakt", "nachname"], "> Nachname: ")
-
-        if "strasse" not in kontaktdaten["kontakt"] and command == "search":
+                kontaktdaten, ["zeitrahmen", "bis_datum"],
+                "> Bis Datum (Leer lassen zum Überspringen): ",
+                lambda x: x if x else None)  # Leeren String zu None umwandeln
             input_kontaktdaten_key(
-                kontaktdaten, ["kontakt", "strasse"], "> Strasse (ohne Hausnummer): ")
-
-        if "hausnummer" not in kontaktdaten["kontakt"] and command == "search":
-            input_kontaktdaten_key(
-                kontaktdaten, ["kontakt", "hausnummer"], "> Hausnummer: ")
-
-        if "plz" not in kontaktdaten["kontakt"] and command == "search":
+                kontaktdaten, ["zeitrahmen", "von_uhrzeit"],
+                "> Von Uhrzeit (Leer lassen zum Überspringen): ",
+                lambda x: x if x else None)  # Leeren String zu None umwandeln
             input_kontaktdaten_key(
-                kontaktdaten, ["kontakt", "plz"], "> PLZ des Wohnorts: ")
-
-        if "ort" not in kontaktdaten["kontakt"] and command == "search":
-            input_kontaktdaten_key(
-                kontaktdaten, ["kontakt", "ort"], "> Wohnort: ")
-
-        if "phone" not in kontaktdaten["kontakt"]:
-            input_kontaktdaten_key(
-                kontaktdaten,
-                ["kontakt", "phone"],
-                "> Telefonnummer: +49",
-                lambda x: x if x.startswith("+49") else f"+49{remove_prefix(x, '0')}")
-
-        if "notificationChannel" not in kontaktdaten["kontakt"]:
-            kontaktdaten["kontakt"]["notificationChannel"] = "email"
-
-        if "notificationReceiver" not in kontaktdaten["kontakt"]:
+                kontaktdaten, ["zeitrahmen", "bis_uhrzeit"],
+                "> Bis Uhrzeit (Leer lassen zum Überspringen): ",
+                lambda x: x if x else None)  # Leeren String zu None umwandeln
+            print(
+                "Trage nun die Wochentage ein, an denen die ausgewählten Impftermine liegen dürfen.\n"
+                "Mehrere Wochentage können durch Komma getrennt werden.\n"
+                "Beispiel: Mo, Di, Mi, Do, Fr, Sa, So\n"
+                "Leer lassen, um alle Wochentage auszuwählen.")
             input_kontaktdaten_key(
-                kontaktdaten, ["kontakt", "notificationReceiver"], "> Mail: ")
-
-        if configure_notifications:
-            if "notifications" not in kontaktdaten:
-                kontaktdaten["notifications"] = {}
-            if "pushover" not in kontaktdaten["notifications"]:
-                while True:
-                    kontaktdaten["notifications"]["pushover"] = {}
-                    if input("> Benachtigung mit Pushover einrichten? (y/n): ").lower() != "n":
-                        print()
-                        input_kontaktdaten_key(
-                            kontaktdaten, ["notifications", "pushover", "app_token"],
-                            "> Geben Sie den Pushover APP Token ein: ")
-                        input_kontaktdaten_key(
-                            kontaktdaten, ["notifications", "pushover", "user_key"],
-                            "> Geben Sie den Pushover User Key ein: ")
-                        try:
-                            validation_code = str(pushover_validation(kontaktdaten["notifications"]["pushover"]))
-                        except PushoverNotificationError as exc:
-                            print(f"Fehler: {exc}\nBitte versuchen Sie es erneut.")
-                            continue
-                        validation_input = input("Geben Sie den Validierungscode ein:").strip()
-                        if validation_input == validation_code:
-                            break
-                        del kontaktdaten["notifications"]["pushover"]
-                        print("Validierung fehlgeschlagen.")
-                        print()
-                    else:
-                        print()
-                        break
-
-            if "telegram" not in kontaktdaten["notifications"]:
-                while True:
-                    kontaktdaten["notifications"]["telegram"] = {}
-                    if input("> Benachtigung mit Telegram einrichten? (y/n): ").lower() != "n":
-                        print()
-                        input_kontaktdaten_key(
-                            kontaktdaten, ["notifications", "telegram", "api_token"],
-                            "> Geben Sie den Telegram API Token ein: ")
-                        input_kontaktdaten_key(
-                            kontaktdaten, ["notifications", "telegram", "chat_id"],
-                            "> Geben Sie die Telegram Chat ID ein: ")
-                        try:
-                            validation_code = str(telegram_validation(kontaktdaten["notifications"]["telegram"]))
-                        except TelegramNotificationError as exc:
-                            print(f"Fehler: {exc}\nBitte versuchen Sie es erneut.")
-                            continue
-                        validation_input = input("Geben Sie den Validierungscode ein:").strip()
-                        if validation_input == validation_code:
-                            break
-                        del kontaktdaten["notifications"]["telegram"]
-                        print("Validierung fehlgeschlagen.")
-                        print()
-                    else:
-                        print()
-                        break
-
-        if "zeitrahmen" not in kontaktdaten and command == "search":
-            kontaktdaten["zeitrahmen"] = {}
-            if input("> Zeitrahmen festlegen? (y/n): ").lower() != "n":
-                print()
-                input_kontaktdaten_key(
-                    kontaktdaten, ["zeitrahmen", "einhalten_bei"],
-                    "> Für welchen Impftermin soll der Zeitrahmen gelten? (1/2/beide): ")
-                input_kontaktdaten_key(
-                    kontaktdaten, ["zeitrahmen", "von_datum"],
-                    "> Von Datum (Leer lassen zum Überspringen): ",
-                    lambda x: x if x else None)  # Leeren String zu None umwandeln
-                input_kontaktdaten_key(
-                    kontaktdaten, ["zeitrahmen", "bis_datum"],
-                    "> Bis Datum (Leer lassen zum Überspringen): ",
-                    lambda x: x if x else None)  # Leeren String zu None umwandeln
-                input_kontaktdaten_key(
-                    kontaktdaten, ["zeitrahmen", "von_uhrzeit"],
-                    "> Von Uhrzeit (Leer lassen zum Überspringen): ",
-                    lambda x: x if x else None)  # Leeren String zu None umwandeln
-                input_kontaktdaten_key(
-                    kontaktdaten, ["zeitrahmen", "bis_uhrzeit"],
-                    "> Bis Uhrzeit (Leer lassen zum Überspringen): ",
-                    lambda x: x if x else None)  # Leeren String zu None umwandeln
-                print(
-                    "Trage nun die Wochentage ein, an denen die ausgewählten Impftermine liegen dürfen.\n"
-                    "Mehrere Wochentage können durch Komma getrennt werden.\n"
-                    "Beispiel: Mo, Di, Mi, Do, Fr, Sa, So\n"
-                    "Leer lassen, um alle Wochentage auszuwählen.")
-                input_kontaktdaten_key(
-                    kontaktdaten, ["zeitrahmen", "wochentage"],
-                    "> Erlaubte Wochentage: ", parse_wochentage)
-            print()
-
-        json.dump(kontaktdaten, file, ensure_ascii=False, indent=4)
+                kontaktdaten, ["zeitrahmen", "wochentage"],
+                "> Erlaubte Wochentage: ", parse_wochentage)
+        print()
+
+    validate_kontaktdaten(kontaktdaten)
+
+    # Erst in eine temporäre Datei schreiben und dann ersetzen, damit die
+    # vorhandene Datei bei einem Abbruch nicht leer zurückbleibt.
+    tmp_filepath = filepath + ".tmp"
+    if ENABLE_ORJSON:
+        # orjson schreibt direkt UTF-8-Bytes, unterstützt aber nur 2er-Einrückung
+        with open(tmp_filepath, 'wb') as file:
+            file.write(orjson.dumps(kontaktdaten, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_filepath, 'w', encoding='utf-8') as file:
+            json.dump(kontaktdaten, file, ensure_ascii=False, indent=4)
+    os.replace(tmp_filepath, filepath)
 
     return kontaktdaten
 
@@ -234,7 +295,13 @@ def input_kontaktdaten_key(
             # Wenn transformer None zurückgibt, setzen wir den Key nicht.
             if value is not None:
                 target[key] = value
-                validate_kontaktdaten(kontaktdaten)
+                # Nur den neuen Wert validieren, die vollständigen
+                # Kontaktdaten werden vor dem Abspeichern validiert.
+                validate_kontaktdaten_field(path, value)
+                if path[0] == "zeitrahmen":
+                    # Abhängigkeiten zwischen von/bis direkt prüfen, damit die
+                    # Eingabe wiederholt werden kann.
+                    validate_zeitrahmen(kontaktdaten["zeitrahmen"])
             break
         except ValidationError as exc:
             print(f"\n{str(exc)}\n")
@@ -254,17 +321,19 @@ def run_search_interactive(kontaktdaten_path, configure_notifications, check_del
     :param configure_notifications: Wird durchgereicht zu update_kontaktdaten_interactive()
     """
 
+    basename = os.path.basename(kontaktdaten_path)
+
     print(
         "Bitte trage zunächst deinen Impfcode und deine Kontaktdaten ein.\n"
-        f"Die Daten werden anschließend lokal in der Datei '{os.path.basename(kontaktdaten_path)}' abgelegt.\n"
+        f"Die Daten werden anschließend lokal in der Datei '{basename}' abgelegt.\n"
         "Du musst sie zukünftig nicht mehr eintragen.\n")
 
     kontaktdaten = {}
     if os.path.isfile(kontaktdaten_path):
         daten_laden = input(
-            f"> Sollen die vorhandenen Daten aus '{os.path.basename(kontaktdaten_path)}' geladen werden? (y/n): ").lower()
+            f"> Sollen die vorhandenen Daten aus '{basename}' geladen werden? (y/n): ").lower()
         if daten_laden.lower() != "n":
-            kontaktdaten = get_kontaktdaten(kontaktdaten_path)
+            kontaktdaten = get_kontaktdaten_cached(kontaktdaten_path)
 
     print()
     kontaktdaten = update_kontaktdaten_interactive(
@@ -279,6 +348,10 @@ def run_search(kontaktdaten, check_delay):
     :param kontaktdaten: Dictionary mit Kontaktdaten
     """
 
+    # Erst hier importieren, da tools.its Selenium & Co. lädt, was den
+    # Programmstart merklich verzögert.
+    from tools.its import ImpfterminService
+
     try:
         codes = kontaktdaten["codes"]
 
@@ -327,18 +400,20 @@ def gen_code_interactive(kontaktdaten_path):
     :param kontaktdaten_path: Pfad zur JSON-Datei mit Kontaktdaten. Default: kontaktdaten.json im aktuellen Ordner
     """
 
+    basename = os.path.basename(kontaktdaten_path)
+
     print(
         "Du kannst dir jetzt direkt einen Vermittlungscode erstellen.\n"
         "Dazu benötigst du eine Mailadresse, Telefonnummer und die PLZ deines Impfzentrums.\n"
-        f"Die Daten werden anschließend lokal in der Datei '{os.path.basename(kontaktdaten_path)}' abgelegt.\n"
+        f"Die Daten werden anschließend lokal in der Datei '{basename}' abgelegt.\n"
         "Du musst sie zukünftig nicht mehr eintragen.\n")
 
     kontaktdaten = {}
     if os.path.isfile(kontaktdaten_path):
         daten_laden = input(
-            f"> Sollen die vorhandenen Daten aus '{os.path.basename(kontaktdaten_path)}' geladen werden (y/n)?: ").lower()
+            f"> Sollen die vorhandenen Daten aus '{basename}' geladen werden (y/n)?: ").lower()
         if daten_laden.lower() != "n":
-            kontaktdaten = get_kontaktdaten(kontaktdaten_path)
+            kontaktdaten = get_kontaktdaten_cached(kontaktdaten_path)
 
     print()
     kontaktdaten = update_kontaktdaten_interactive(
@@ -365,6 +440,8 @@ def gen_code(kontaktdaten):
             "Bitte überprüfe, ob sie im korrekten JSON-Format sind oder gebe "
             "deine Daten beim Programmstart erneut ein.\n") from exc
 
+    # Erst hier importieren, siehe run_search()
+    from tools.its import ImpfterminService
     its = ImpfterminService([], {}, PATH)
 
     print("\nBitte trage nachfolgend dein Geburtsdatum im Format DD.MM.YYYY ein.\n"
@@ -394,9 +471,9 @@ def gen_code(kontaktdaten):
 def subcommand_search(args):
     if args.configure_only:
         update_kontaktdaten_interactive(
-            get_kontaktdaten(args.file), "search", args.configure_notifications, args.file)
+            get_kontaktdaten_cached(args.file), "search", args.configure_notifications, args.file)
     elif args.read_only:
-        run_search(get_kontaktdaten(args.file), check_delay=args.retry_sec)
+        run_search(get_kontaktdaten_cached(args.file), check_delay=args.retry_sec)
     else:
         run_search_interactive(args.file, args.configure_notifications, check_delay=args.retry_sec)
 
@@ -404,9 +481,9 @@ def subcommand_search(args):
 def subcommand_code(args):
     if args.configure_only:
         update_kontaktdaten_interactive(
-            get_kontaktdaten(args.file), "code", args.file)
+            get_kontaktdaten_cached(args.file), "code", False, args.file)
     elif args.read_only:
-        gen_code(get_kontaktdaten(args.file))
+        gen_code(get_kontaktdaten_cached(args.file))
     else:
         gen_code_interactive(args.file)
 
@@ -424,18 +501,49 @@ def subcommand_install_chromium():
             download_webdriver()
 
 
-def validate_args(args):
+def validate_args(settings):
     """
-    Raises ValueError if args contain invalid settings.
+    Raises ValueError if settings are invalid.
     """
 
-    if args.configure_only and args.read_only:
+    if settings.configure_only and settings.read_only:
         raise ValueError(
             "--configure-only und --read-only kann nicht gleichzeitig verwendet werden")
 
 
-def main():
-    create_missing_dirs(PATH)
+@dataclass
+class Settings:
+    """
+    Einstellungen aus der Kommandozeile bzw. dem interaktiven Menü.
+    """
+
+    command: Optional[str] = None
+    file: str = DEFAULT_KONTAKTDATEN_PATH
+    configure_only: bool = False
+    read_only: bool = False
+    configure_notifications: bool = False
+    retry_sec: int = 1
+
+    def toggle(self, name: str):
+        """
+        Schaltet die boolesche Einstellung `name` um.
+
+        :raise ValueError: Die Einstellungen wären danach ungültig. Die
+            Einstellung bleibt in diesem Fall unverändert.
+        """
+
+        setattr(self, name, not getattr(self, name))
+        try:
+            validate_args(self)
+        except ValueError:
+            setattr(self, name, not getattr(self, name))
+            raise
+
+
+def get_parser():
+    """
+    Erstellt den ArgumentParser mit den Subcommands "search" und "code".
+    """
 
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers(help="commands", dest="command")
@@ -475,35 +583,34 @@ def main():
         parents=[base_subparser],
         help="Vermittlungscode generieren")
 
-    args = parser.parse_args()
+    return parser
+
 
-    if not hasattr(args, "file") or args.file is None:
-        args.file = os.path.join(PATH, "data/kontaktdaten.json")
-    if not hasattr(args, "configure_only"):
-        args.configure_only = False
-    if not hasattr(args, "read_only"):
-        args.read_only = False
-    if not hasattr(args, "retry_sec"):
-        args.retry_sec = 1
-    if not hasattr(args, "configure_notifications"):
-        args.configure_notifications = False
+def main():
+    create_missing_dirs(PATH)
+
+    parser = get_parser()
+    args = parser.parse_args()
+    # Nicht angegebene Optionen (None bzw. fehlend ohne Subcommand) über die
+    # Defaults von Settings setzen
+    settings = Settings(**{k: v for k, v in vars(args).items() if v is not None})
 
     try:
-        validate_args(args)
+        validate_args(settings)
     except ValueError as exc:
         parser.error(str(exc))
         # parser.error terminates the program with status code 2.
 
-    if args.command is not None:
+    if settings.command is not None:
         try:
-            if args.command == "search":
-                subcommand_search(args)
-            elif args.command == "code":
-                subcommand_code(args)
+            if settings.command == "search":
+                subcommand_search(settings)
+            elif settings.command == "code":
+                subcommand_code(settings)
             else:
                 assert False
         except ValidationError as exc:
-            print(f"Fehler in {json.dumps(args.file)}:\n{str(exc)}")
+            print(f"Fehler in {json.dumps(settings.file)}:\n{str(exc)}")
 
     else:
         extended_settings = False
@@ -518,46 +625,37 @@ def main():
 
             if extended_settings:
                 print(
-                    f"[c] --configure-only {'de' if args.configure_only else ''}aktivieren\n"
-                    f"[r] --read-only {'de' if args.read_only else ''}aktivieren\n"
+                    f"[c] --configure-only {'de' if settings.configure_only else ''}aktivieren\n"
+                    f"[r] --read-only {'de' if settings.read_only else ''}aktivieren\n"
                     "[s] --retry-sec setzen\n"
-                    f"[n] --configure-notifications {'de' if args.configure_notifications else ''}aktivieren\n\n")
+                    f"[n] --configure-notifications {'de' if settings.configure_notifications else ''}aktivieren\n\n")
 
             option = input("> Option: ").lower()
             print()
 
             try:
                 if option == "1":
-                    subcommand_search(args)
+                    subcommand_search(settings)
                 elif option == "2":
-                    subcommand_code(args)
+                    subcommand_code(settings)
                 elif option == "3":
                     subcommand_install_chromium()
                 elif option == "x":
                     extended_settings = not extended_settings
                 elif extended_settings and option == "c":
-                    new_args = copy.copy(args)
-                    new_args.configure_only = not new_args.configure_only
-                    validate_args(new_args)
-                    args = new_args
+                    settings.toggle("configure_only")
                     print(
-                        f"--configure-only {'de' if not args.configure_only else ''}aktiviert.")
+                        f"--configure-only {'de' if not settings.configure_only else ''}aktiviert.")
                 elif extended_settings and option == "r":
-                    new_args = copy.copy(args)
-                    new_args.read_only = not new_args.read_only
-                    validate_args(new_args)
-                    args = new_args
+                    settings.toggle("read_only")
                     print(
-                        f"--read-only {'de' if not args.read_only else ''}aktiviert.")
+                        f"--read-only {'de' if not settings.read_only else ''}aktiviert.")
                 elif extended_settings and option == "s":
-                    args.retry_sec = int(input("> --retry-sec="))
+                    settings.retry_sec = int(input("> --retry-sec="))
                 elif extended_settings and option == "n":
-                    new_args = copy.copy(args)
-                    new_args.configure_notifications = not new_args.configure_notifications
-                    validate_args(new_args)
-                    args = new_args
+                    settings.toggle("configure_notifications")
                     print(
-                        f"--configure-notifications {'de' if not args.configure_notifications else ''}aktiviert.")
+                        f"--configure-notifications {'de' if not settings.configure_notifications else ''}aktiviert.")
                 else:
                     print("Falscheingabe! Bitte erneut versuchen.")
                 print()
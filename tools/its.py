@@ -3,6 +3,7 @@ import copy
 import json
 import os
 import platform
+import secrets
 import string
 import sys
 import time
@@ -12,7 +13,7 @@ from datetime import datetime, date, timedelta
 from datetime import time as dtime
 from itertools import cycle
 from json import JSONDecodeError
-from random import choice, choices, randint
+from random import choice, randint
 
 import cloudscraper
 from requests.exceptions import RequestException
@@ -430,7 +431,8 @@ class ImpfterminService():
     def driver_get_cookies(self, driver, url, manual):
         # Erstelle zufälligen Vermittlungscode für die Cookie-Generierung
         chars = string.ascii_uppercase + string.digits
-        random_code = f"{choices(chars, k=4)}-{choices(chars, k=4)}-{choices(chars, k=4)}"
+        code = "".join(secrets.choice(chars) for _ in range(12))
+        random_code = f"{code[:4]}-{code[4:8]}-{code[8:]}"
 
         # Kann WebDriverException nach außen werfen:
         self.driver_enter_code(
@@ -16,6 +16,13 @@ WOCHENTAG_NAMES = [
     "Samstag",
     "Sonntag"]
 
+# Vorkompilierte Muster, da die Validierung bei jeder Eingabe aufgerufen wird
+_C = "[0-9a-zA-Z]"
+CODE_PATTERN = re.compile(f"^{4 * _C}-{4 * _C}-{4 * _C}$")
+PLZ_PATTERN = re.compile(f"^{5 * '[0-9]'}$")
+PHONE_PATTERN = re.compile(r"^\+49[1-9][0-9]+$")
+TELEGRAM_API_TOKEN_PATTERN = re.compile(r"\w+:\w+")
+
 
 def get_kontaktdaten(filepath: str):
     """
@@ -138,8 +145,7 @@ def validate_codes(codes: list):
     for code in codes:
         if not isinstance(code, str):
             raise ValidationError("Darf nur Zeichenketten enthalten")
-        c = "[0-9a-zA-Z]"
-        if not re.match(f"^{4 * c}-{4 * c}-{4 * c}$", code):
+        if not CODE_PATTERN.match(code):
             raise ValidationError(
                 f"{json.dumps(code)} entspricht nicht dem Schema \"XXXX-XXXX-XXXX\"")
 
@@ -177,7 +183,7 @@ def validate_plz(plz: str):
     if not isinstance(plz, str):
         raise ValidationError("Muss eine Zeichenkette sein")
 
-    if not re.match(f"^{5 * '[0-9]'}$", plz):
+    if not PLZ_PATTERN.match(plz):
         raise ValidationError(
             f"Ungültige PLZ {json.dumps(plz)} - muss aus genau 5 Ziffern bestehen")
 
@@ -198,10 +204,7 @@ def validate_kontakt(kontakt: dict):
     for key, value in kontakt.items():
         try:
             if key in ["anrede", "vorname", "nachname", "strasse", "ort"]:
-                if not isinstance(value, str):
-                    raise ValidationError("Muss eine Zeichenkette sein")
-                if value.strip() == "":
-                    raise ValidationError(f"Darf nicht leer sein")
+                validate_nicht_leer(value)
             elif key == "plz":
                 validate_plz(value)
             elif key == "hausnummer":
@@ -209,8 +212,7 @@ def validate_kontakt(kontakt: dict):
             elif key == "phone":
                 validate_phone(value)
             elif key == "notificationChannel":
-                if value != "email":
-                    raise ValidationError("Muss auf \"email\" gesetzt werden")
+                validate_notification_channel(value)
             elif key == "notificationReceiver":
                 validate_email(value)
             else:
@@ -220,6 +222,48 @@ def validate_kontakt(kontakt: dict):
                 f"Ungültiger Key {json.dumps(key)}:\n{str(exc)}")
 
 
+def validate_nicht_leer(value: str):
+    """
+    Validiert eine Zeichenkette auf: Typ, "leer"
+
+    :raise ValidationError: Typ ist nicht str
+    :raise ValidationError: Zeichenkette ist leer
+    """
+
+    if not isinstance(value, str):
+        raise ValidationError("Muss eine Zeichenkette sein")
+    if value.strip() == "":
+        raise ValidationError(f"Darf nicht leer sein")
+
+
+def validate_notification_channel(notification_channel: str):
+    """
+    Validiert "kontakt"."notificationChannel"-Key aus Kontaktdaten.
+
+    :raise ValidationError: Wert ist nicht "email"
+    """
+
+    if notification_channel != "email":
+        raise ValidationError("Muss auf \"email\" gesetzt werden")
+
+
+def validate_wochentage(wochentage: list):
+    """
+    Validiert eine Liste von Wochentagen mithilfe von validate_wochentag.
+
+    :raise ValidationError: Typ ist nicht list
+    :raise ValidationError: Liste ist leer
+    :raise ValidationError: Liste enthält ungültigen Wochentag
+    """
+
+    if not isinstance(wochentage, list):
+        raise ValidationError("Muss eine Liste sein")
+    if not wochentage:
+        raise ValidationError("Darf keine leere Liste sein")
+    for weekday in wochentage:
+        validate_wochentag(weekday)
+
+
 def validate_phone(phone: str):
     """
     Validiert Telefonnummer auf: Typ, Präfix, "leer"
@@ -235,7 +279,7 @@ def validate_phone(phone: str):
     if not isinstance(phone, str):
         raise ValidationError("Muss eine Zeichenkette sein")
 
-    if not re.match(r"^\+49[1-9][0-9]+$", phone):
+    if not PHONE_PATTERN.match(phone):
         raise ValidationError(
             f"Ungültige Telefonnummer {json.dumps(phone)}")
 
@@ -315,12 +359,7 @@ def validate_zeitrahmen(zeitrahmen: dict):
             elif key in ["von_uhrzeit", "bis_uhrzeit"]:
                 validate_uhrzeit(value)
             elif key == "wochentage":
-                if not isinstance(value, list):
-                    raise ValidationError("Muss eine Liste sein")
-                if not value:
-                    raise ValidationError("Darf keine leere Liste sein")
-                for weekday in value:
-                    validate_wochentag(weekday)
+                validate_wochentage(value)
             elif key == "einhalten_bei":
                 validate_einhalten_bei(value)
             else:
@@ -438,7 +477,7 @@ def validate_telegram_api_token(telegram_api_token: str):
 
     if not isinstance(telegram_api_token, str):
         raise ValidationError("Muss eine Zeichenkette sein")
-    if not re.search(r"\w+:\w+", telegram_api_token):
+    if not TELEGRAM_API_TOKEN_PATTERN.search(telegram_api_token):
         raise ValidationError("Der Telegram API-Token besteht aus zwei Teilen welche durch \":\" getrennt sind.")
 
 
@@ -525,6 +564,61 @@ def validate_einhalten_bei(einhalten_bei: str):
         raise ValidationError('Erlaubt sind: "1", "2", "beide"')
 
 
+# Validierungsfunktionen für einzelne Werte der Kontaktdaten, adressiert über
+# den Pfad der Keys (siehe validate_kontaktdaten_field).
+FIELD_VALIDATORS = {
+    ("codes",): validate_codes,
+    ("plz_impfzentren",): validate_plz_impfzentren,
+    ("kontakt", "anrede"): validate_nicht_leer,
+    ("kontakt", "vorname"): validate_nicht_leer,
+    ("kontakt", "nachname"): validate_nicht_leer,
+    ("kontakt", "strasse"): validate_nicht_leer,
+    ("kontakt", "hausnummer"): validate_hausnummer,
+    ("kontakt", "plz"): validate_plz,
+    ("kontakt", "ort"): validate_nicht_leer,
+    ("kontakt", "phone"): validate_phone,
+    ("kontakt", "notificationChannel"): validate_notification_channel,
+    ("kontakt", "notificationReceiver"): validate_email,
+    ("notifications", "pushover", "app_token"): validate_pushover_app_token,
+    ("notifications", "pushover", "user_key"): validate_pushover_user_key,
+    ("notifications", "telegram", "api_token"): validate_telegram_api_token,
+    ("notifications", "telegram", "chat_id"): validate_telegram_chat_id,
+    ("zeitrahmen", "einhalten_bei"): validate_einhalten_bei,
+    ("zeitrahmen", "von_datum"): validate_datum,
+    ("zeitrahmen", "bis_datum"): validate_datum,
+    ("zeitrahmen", "von_uhrzeit"): validate_uhrzeit,
+    ("zeitrahmen", "bis_uhrzeit"): validate_uhrzeit,
+    ("zeitrahmen", "wochentage"): validate_wochentage,
+}
+
+
+def validate_kontaktdaten_field(path: list, value):
+    """
+    Validiert einen einzelnen Wert der Kontaktdaten, ohne die restlichen
+    Kontaktdaten erneut zu validieren.
+    Abhängigkeiten zwischen mehreren Werten (z. B. "von_datum" und
+    "bis_datum") werden nicht geprüft, dafür ist validate_kontaktdaten da.
+
+    :param path: Pfad der Keys zum Wert, z. B. ["kontakt", "plz"]
+    :param value: Zu validierender Wert
+
+    :raise ValidationError: Pfad ist unbekannt
+    :raise ValidationError: Wert ist ungültig
+    """
+
+    try:
+        validator = FIELD_VALIDATORS.get(tuple(path))
+        if validator is None:
+            raise ValidationError(f"Nicht unterstützter Key")
+        validator(value)
+    except ValidationError as exc:
+        # Fehlermeldung genauso verschachteln wie in validate_kontaktdaten
+        message = str(exc)
+        for key in reversed(path):
+            message = f"Ungültiger Key {json.dumps(key)}:\n{message}"
+        raise ValidationError(message)
+
+
 def decode_wochentag(wochentag: str):
     """
     Wandelt einen Wochentag-Namen in seinen Index um, d. h. "Montag" -> 0,